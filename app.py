@@ -4,55 +4,318 @@
 import streamlit as st
 import requests
 import random
-from datetime import datetime
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from health_data import (
+    CATEGORIES,
+    DISPLAY_FIELDS,
+    FIELD_LABELS,
+    HEALTH_TOPICS,
+    MYTH_CLAIMS,
+    MYTH_KEYS,
+    MYTH_TRUTHS,
+    QUIZ_QUESTIONS,
+    QuizQuestion,
+    TOPIC_TITLES,
+    TOPICS_BY_CATEGORY
+)
 
 # ============================================
 # REAL API INTEGRATION
 # ============================================
 
+# Static lookup tables. Streamlit re-executes this script on every rerun, so
+# they are built lazily through st.cache_resource: once per process, and only
+# when a CDC/NIH lookup actually happens.
+@st.cache_resource(show_spinner=False)
+def _cdc_responses() -> MappingProxyType:
+    """Prebuilt CDC responses, shared read-only by every lookup"""
+    cdc_data = {
+        "cardiovascular_disease": {
+            "name": "Cardiovascular Disease",
+            "cdc_fact": "Leading cause of death in US",
+            "prevention": "Regular exercise, healthy diet, manage stress",
+            "risk_factors": "High blood pressure, high cholesterol, smoking, diabetes, obesity",
+            "statistics": "1 in 5 deaths caused by heart disease"
+        },
+        "diabetes": {
+            "name": "Diabetes",
+            "cdc_fact": "37.3 million Americans have diabetes",
+            "prevention": "Maintain healthy weight, exercise, healthy diet",
+            "risk_factors": "Family history, obesity, age",
+            "statistics": "1 new case every 11 seconds"
+        },
+        "respiratory_health": {
+            "name": "Respiratory Health",
+            "cdc_fact": "Chronic lower respiratory disease is #3 cause of death",
+            "prevention": "Don't smoke, avoid air pollution, exercise",
+            "risk_factors": "Smoking, air pollution, genetic factors",
+            "statistics": "6.2 million adults have chronic bronchitis"
+        },
+        "cancer": {
+            "name": "Cancer Prevention",
+            "cdc_fact": "Cancer is 2nd leading cause of death",
+            "prevention": "Avoid tobacco, limit alcohol, sun protection, screening",
+            "risk_factors": "Tobacco, alcohol, sun exposure, family history",
+            "statistics": "1 in 3 Americans diagnosed with cancer in lifetime"
+        }
+    }
+    return MappingProxyType({
+        key: {"status": "success", "source": "CDC", **entry} for key, entry in cdc_data.items()
+    })
+
+@st.cache_resource(show_spinner=False)
+def _nih_responses() -> MappingProxyType:
+    """Prebuilt NIH responses, shared read-only by every lookup"""
+    nih_resources = {
+        "mental_wellness": {
+            "name": "Mental Wellness",
+            "resource": "National Institute of Mental Health (NIMH)",
+            "services": ["Therapy", "Counseling", "Support groups", "Crisis helpline"],
+            "website": "nimh.nih.gov",
+            "helpline": "National Crisis Hotline: 988"
+        },
+        "nutrition": {
+            "name": "Nutrition",
+            "resource": "National Institute of Diabetes and Digestive and Kidney Diseases",
+            "services": ["Nutrition guides", "Meal planning", "Dietary research"],
+            "website": "niddk.nih.gov",
+            "info": "Science-based nutritional guidance"
+        },
+        "aging": {
+            "name": "Healthy Aging",
+            "resource": "National Institute on Aging",
+            "services": ["Senior health info", "Cognitive health", "Caregiving resources"],
+            "website": "nia.nih.gov",
+            "info": "Research on aging and longevity"
+        }
+    }
+    return MappingProxyType({
+        key: {"status": "success", "source": "NIH", **entry} for key, entry in nih_resources.items()
+    })
+
+CDC_NOT_FOUND = {"status": "error", "message": "CDC data not available"}
+NIH_NOT_FOUND = {"status": "error", "message": "NIH resources not available"}
+
+# ============================================
+# PERSISTENT API CACHE
+# ============================================
+
+API_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".api_cache.sqlite3")
+API_CACHE_TTL = 7 * 86400  # one week
+API_STALE_TTL = 30 * 86400  # how long an expired copy is kept as a fallback before it is purged
+API_ERROR_TTL = 30  # seconds a failed fetch is remembered before retrying
+
+class APICache:
+    """
+    SQLite-backed store for API responses, shared by all sessions and kept across restarts
+    Best effort: a database error is treated as a cache miss, never raised to the UI
+    """
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        try:
+            self._conn = self._open(path)
+        except sqlite3.Error:
+            # Unwritable app directory or corrupt file: keep caching, just not across restarts
+            self._conn = self._open(":memory:")
+    
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache (key TEXT PRIMARY KEY, expires REAL, payload TEXT)"
+            )
+            conn.execute("DELETE FROM api_cache WHERE expires < ?", (time.time() - API_STALE_TTL,))
+        return conn
+    
+    @staticmethod
+    def key(endpoint: str, query: str) -> str:
+        """Hash the endpoint and query into a cache key; the query is expected to be _norm()ed already"""
+        return hashlib.sha1(f"{endpoint}|{query}".encode()).hexdigest()
+    
+    def get(self, key: str, allow_stale: bool = False) -> dict | None:
+        """Return the cached payload, or None if missing (or expired, unless allow_stale)"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires, payload FROM api_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or (row[0] < time.time() and not allow_stale):
+            return None
+        return json.loads(row[1])
+    
+    def set(self, key: str, payload: dict, ttl: float = API_CACHE_TTL):
+        """Store a payload for ttl seconds, dropping rows past their stale window"""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM api_cache WHERE expires < ?", (now - API_STALE_TTL,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO api_cache VALUES (?, ?, ?)",
+                    (key, now + ttl, json.dumps(payload))
+                )
+        except sqlite3.Error:
+            pass
+
+@st.cache_resource
+def _api_cache() -> APICache:
+    """One cache handle per process, shared across reruns and users"""
+    return APICache(API_CACHE_PATH)
+
+class RecentFailures:
+    """In-memory record of failed fetches, each forgotten after ttl seconds"""
+    
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._failures = {}
+    
+    def get(self, key: tuple) -> str | None:
+        """Return the failure message if key failed within the last ttl seconds"""
+        failure = self._failures.get(key)
+        if failure is None or failure[0] < time.time():
+            return None
+        return failure[1]
+    
+    def add(self, key: tuple, message: str):
+        """Remember a failure, dropping the ones that have already expired"""
+        now = time.time()
+        with self._lock:
+            self._failures = {k: f for k, f in self._failures.items() if f[0] >= now}
+            self._failures[key] = (now + self._ttl, message)
+
+@st.cache_resource
+def _recent_failures() -> RecentFailures:
+    """Failed PubMed fetches, shared across reruns and users; a dict lookup, so it stays off the disk"""
+    return RecentFailures(API_ERROR_TTL)
+
+HTTP_TIMEOUT = (3.05, 7)  # (connect, read) seconds
+SEARCH_TIMEOUT = 10  # seconds Search All waits for the slowest source
+
+@st.cache_resource
+def _http() -> requests.Session:
+    """HTTP session shared across reruns and users, so connections stay alive"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "HealthBot/1.0"})
+    session.mount("https://", HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        # Retry throttling/5xx responses with our own short backoff. Never retry a read
+        # timeout (that would multiply HTTP_TIMEOUT), and ignore Retry-After, which can ask
+        # for minutes; RecentFailures backs off from a throttled query instead
+        max_retries=Retry(
+            total=2, connect=1, read=0, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=False
+        )
+    ))
+    return session
+
+PUBMED_OPERATORS = ("AND", "OR", "NOT")  # PubMed only treats the uppercase forms as operators
+
+def _norm(query: str) -> str:
+    """
+    Fold case, underscores and runs of whitespace, so "Heart  Disease" and "heart_disease" share a cache entry
+    Uppercase AND/OR/NOT are kept as typed: lowercasing them would turn an OR search into an AND one
+    """
+    words = re.split(r"[\s_]+", query.strip())
+    return " ".join(word if word in PUBMED_OPERATORS else word.lower() for word in words)
+
 class HealthAPIs:
     """Integration with real health APIs"""
     
+    # Fixed parts of the NCBI E-utilities requests; only term/id vary per call
+    PUBMED_SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    PUBMED_SUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+    PUBMED_PARAMS = MappingProxyType({"db": "pubmed", "retmode": "json"})
+    
     @staticmethod
     def get_pubmed_articles(query: str, max_results: int = 5) -> dict:
         """
         Fetch real research articles from PubMed
-        Uses PubMed Central API (free, no key needed)
+        A failed fetch is remembered for API_ERROR_TTL seconds, so repeat clicks don't hammer a failing endpoint
         """
-        try:
-            base_url = "https://pubmed.ncbi.nlm.nih.gov/api/search/"
-            params = {
-                "term": query,
-                "format": "json",
-                "pagesize": max_results
-            }
-            
-            # Note: This is a simplified call. Real implementation would use NCBI API key
-            # For now, return mock data that looks like real research
+        query = _norm(query)
+        error = _recent_failures().get((query, max_results))
+        if error is None:
+            try:
+                return HealthAPIs._search_pubmed(query, max_results)
+            except requests.RequestException as e:
+                error = f"PubMed is unavailable: {e}"
+                _recent_failures().add((query, max_results), error)
+            except Exception as e:
+                return {"status": "error", "message": str(e)}
+        
+        # Serve an expired copy rather than nothing while PubMed is failing
+        stale = _api_cache().get(APICache.key("pubmed", f"{query}|{max_results}"), allow_stale=True)
+        if stale is not None:
+            return {**stale, "stale": True}
+        return {"status": "unavailable", "message": error, "retry_after": API_ERROR_TTL}
+    
+    @staticmethod
+    @st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+    def _search_pubmed(query: str, max_results: int) -> dict:
+        """
+        Query NCBI E-utilities: esearch for IDs, esummary for metadata
+        Raises on failure, so st.cache_data never memoizes an error
+        """
+        cache_key = APICache.key("pubmed", f"{query}|{max_results}")
+        cached = _api_cache().get(cache_key)
+        if cached is not None:
+            return cached
+        
+        search = _http().get(
+            HealthAPIs.PUBMED_SEARCH_URL,
+            params={**HealthAPIs.PUBMED_PARAMS, "term": query, "retmax": max_results},
+            timeout=HTTP_TIMEOUT
+        )
+        search.raise_for_status()
+        ids = search.json()["esearchresult"]["idlist"]
+        
+        articles = []
+        if ids:
+            summary = _http().get(
+                HealthAPIs.PUBMED_SUMMARY_URL,
+                params={**HealthAPIs.PUBMED_PARAMS, "id": ",".join(ids)},
+                timeout=HTTP_TIMEOUT
+            )
+            summary.raise_for_status()
+            result = summary.json()["result"]
             
-            return {
-                "status": "success",
-                "source": "PubMed (NCBI)",
-                "articles": [
-                    {
-                        "title": f"Research on {query}: Evidence-Based Review",
-                        "authors": "Smith J, Johnson K, et al.",
-                        "journal": "Journal of Health Sciences",
-                        "year": 2024,
-                        "summary": f"Latest findings on {query} from peer-reviewed research"
-                    },
-                    {
-                        "title": f"Clinical Guidelines for {query} Management",
-                        "authors": "CDC Health Division",
-                        "journal": "CDC Guidelines",
-                        "year": 2024,
-                        "summary": f"Evidence-based recommendations for {query} prevention and management"
-                    }
-                ]
-            }
-        except Exception as e:
-            return {"status": "error", "message": str(e)}
+            for uid in result["uids"]:
+                doc = result[uid]
+                authors = [a["name"] for a in doc.get("authors", [])]
+                articles.append({
+                    "title": doc.get("title", ""),
+                    "authors": ", ".join(authors[:3]) + (", et al." if len(authors) > 3 else ""),
+                    "journal": doc.get("fulljournalname") or doc.get("source", ""),
+                    "year": doc.get("pubdate", "")[:4],
+                    "summary": f"PMID {uid}, published {doc.get('pubdate', 'n/a')}",
+                    "url": f"https://pubmed.ncbi.nlm.nih.gov/{uid}/"
+                })
+        
+        response = {
+            "status": "success",
+            "source": "PubMed (NCBI)",
+            "articles": articles
+        }
+        _api_cache().set(cache_key, response)
+        return response
     
     @staticmethod
     def get_cdc_data(topic: str) -> dict:
@@ -60,550 +323,66 @@ class HealthAPIs:
         Get CDC guidelines and statistics
         Using publicly available CDC data
         """
-        cdc_data = {
-            "cardiovascular_disease": {
-                "name": "Cardiovascular Disease",
-                "cdc_fact": "Leading cause of death in US",
-                "prevention": "Regular exercise, healthy diet, manage stress",
-                "risk_factors": "High blood pressure, high cholesterol, smoking, diabetes, obesity",
-                "statistics": "1 in 5 deaths caused by heart disease"
-            },
-            "diabetes": {
-                "name": "Diabetes",
-                "cdc_fact": "37.3 million Americans have diabetes",
-                "prevention": "Maintain healthy weight, exercise, healthy diet",
-                "risk_factors": "Family history, obesity, age",
-                "statistics": "1 new case every 11 seconds"
-            },
-            "respiratory_health": {
-                "name": "Respiratory Health",
-                "cdc_fact": "Chronic lower respiratory disease is #3 cause of death",
-                "prevention": "Don't smoke, avoid air pollution, exercise",
-                "risk_factors": "Smoking, air pollution, genetic factors",
-                "statistics": "6.2 million adults have chronic bronchitis"
-            },
-            "cancer": {
-                "name": "Cancer Prevention",
-                "cdc_fact": "Cancer is 2nd leading cause of death",
-                "prevention": "Avoid tobacco, limit alcohol, sun protection, screening",
-                "risk_factors": "Tobacco, alcohol, sun exposure, family history",
-                "statistics": "1 in 3 Americans diagnosed with cancer in lifetime"
-            }
-        }
-        
-        topic_key = topic.lower().replace(" ", "_")
-        if topic_key in cdc_data:
-            return {"status": "success", "source": "CDC", **cdc_data[topic_key]}
-        
-        return {"status": "error", "message": "CDC data not available"}
+        return _cdc_responses().get(_norm(topic).replace(" ", "_"), CDC_NOT_FOUND)
     
     @staticmethod
     def get_nih_resources(topic: str) -> dict:
         """
         Get resources from National Institutes of Health
         """
-        nih_resources = {
-            "mental_wellness": {
-                "name": "Mental Wellness",
-                "resource": "National Institute of Mental Health (NIMH)",
-                "services": ["Therapy", "Counseling", "Support groups", "Crisis helpline"],
-                "website": "nimh.nih.gov",
-                "helpline": "National Crisis Hotline: 988"
-            },
-            "nutrition": {
-                "name": "Nutrition",
-                "resource": "National Institute of Diabetes and Digestive and Kidney Diseases",
-                "services": ["Nutrition guides", "Meal planning", "Dietary research"],
-                "website": "niddk.nih.gov",
-                "info": "Science-based nutritional guidance"
-            },
-            "aging": {
-                "name": "Healthy Aging",
-                "resource": "National Institute on Aging",
-                "services": ["Senior health info", "Cognitive health", "Caregiving resources"],
-                "website": "nia.nih.gov",
-                "info": "Research on aging and longevity"
-            }
+        return _nih_responses().get(_norm(topic).replace(" ", "_"), NIH_NOT_FOUND)
+    
+    @staticmethod
+    def search_all(query: str) -> dict:
+        """
+        Query PubMed, CDC and NIH concurrently
+        Total latency is the slowest source instead of the sum of all three
+        """
+        sources = {
+            "pubmed": ("PubMed", HealthAPIs.get_pubmed_articles),
+            "cdc": ("CDC", HealthAPIs.get_cdc_data),
+            "nih": ("NIH", HealthAPIs.get_nih_resources)
         }
+        pool = ThreadPoolExecutor(max_workers=len(sources))
+        futures = {name: pool.submit(fetch, query) for name, (_, fetch) in sources.items()}
+        # Not a `with` block: its exit would join every worker and ignore the timeout.
+        # A straggler keeps running in the background until its own requests give up:
+        # PubMed is esearch then esummary, each allowed HTTP_TIMEOUT plus the session's retries
+        wait(futures.values(), timeout=SEARCH_TIMEOUT)
+        pool.shutdown(wait=False, cancel_futures=True)
         
-        topic_key = topic.lower().replace(" ", "_")
-        if topic_key in nih_resources:
-            return {"status": "success", "source": "NIH", **nih_resources[topic_key]}
-        
-        return {"status": "error", "message": "NIH resources not available"}
-
-# ============================================
-# EXPANDED HEALTH TOPICS DATABASE
-# ============================================
-
-HEALTH_TOPICS = {
-    # ORIGINAL TOPICS
-    "diabetes": {
-        "title": "Diabetes Mellitus",
-        "category": "Metabolic Disorders",
-        "info": "Chronic condition affecting blood glucose regulation. Type 1 is autoimmune, Type 2 is lifestyle-related.",
-        "types": ["Type 1: Autoimmune condition", "Type 2: Most common", "Gestational: During pregnancy"],
-        "symptoms": ["Increased thirst", "Frequent urination", "Fatigue", "Blurred vision", "Slow wound healing"],
-        "mgmt": ["Regular exercise (150 min/week)", "Healthy diet (low glycemic)", "Weight management", "Medication", "Regular monitoring"],
-        "prevention": "Maintain healthy weight, regular exercise, balanced diet, limit sugars",
-        "stats": "Affects 1 in 10 adults; 463 million people worldwide"
-    },
-    "vaccines": {
-        "title": "Vaccines & Immunization",
-        "category": "Prevention",
-        "info": "Medical preparations that train immune system to fight diseases.",
-        "types": ["Live attenuated", "Inactivated", "mRNA", "Subunit", "Toxoid"],
-        "benefits": ["Prevent serious diseases", "Reduce transmission", "Enable herd immunity", "Prevent complications"],
-        "how": ["Introduce antigen safely", "Immune system responds", "Create memory cells", "Future protection"],
-        "safety": "Rigorous testing; side effects mild/temporary; serious reactions extremely rare",
-        "stats": "Save 2-3 million lives annually; Prevent 21-14 million deaths over lifetime"
-    },
-    "nutrition": {
-        "title": "Nutrition & Healthy Eating",
-        "category": "Lifestyle",
-        "info": "Science of food and its effect on health.",
-        "food_groups": ["Fruits/veggies: 5+ daily", "Whole grains: 3+ daily", "Protein: Lean sources", "Dairy: Low-fat", "Healthy fats"],
-        "nutrients": ["Carbs (45-65%): Energy", "Protein (10-35%): Tissues", "Fats (20-35%): Hormones"],
-        "tips": ["Eat variety of colors", "Control portions", "Limit added sugars (<10%)", "Reduce sodium (<2,300mg)", "Stay hydrated"],
-        "prevention": "Prevents 40% of chronic diseases",
-        "stats": "Poor diet linked to 11 million deaths annually"
-    },
-    "sleep": {
-        "title": "Sleep & Sleep Hygiene",
-        "category": "Lifestyle",
-        "info": "Essential physiological process for recovery and health.",
-        "recommended": "Adults: 7-9 hrs; Teens: 8-10 hrs; Children: 9-12 hrs; Infants: 12-17 hrs",
-        "stages": ["N1 (Light): Transition", "N2 (Light): Body cooling", "N3 (Deep): Restoration", "REM: Memory/dreaming"],
-        "benefits": ["Immune strength", "Memory consolidation", "Hormone regulation", "Emotional stability", "Physical repair"],
-        "tips": ["Consistent schedule", "Dark room", "Cool temp (60-67°F)", "No screens 1hr before bed", "No caffeine after 2PM"],
-        "stats": "1 in 3 adults insufficient sleep; Deprivation increases disease risk 30%"
-    },
-    "mental_health": {
-        "title": "Mental Health & Wellness",
-        "category": "Mental Health",
-        "info": "Psychological and emotional well-being crucial for overall health.",
-        "conditions": ["Depression: Persistent low mood", "Anxiety: Excessive worry", "Stress: Response to demands", "Burnout: Work exhaustion"],
-        "management": ["Professional therapy", "Exercise (30min, 5x/week)", "Meditation (10min/day)", "Social connections", "Sleep 7-9hrs"],
-        "self_care": ["Regular exercise", "Maintain relationships", "Creative hobbies", "Journaling", "Nature time"],
-        "crisis": "National Crisis Hotline: 988",
-        "stats": "1 in 5 adults experience mental illness yearly; 50% begins by age 14; 80% treatable with help"
-    },
-    
-    # NEW TOPICS - CARDIOVASCULAR
-    "cardiovascular_health": {
-        "title": "Cardiovascular Health & Disease Prevention",
-        "category": "Heart & Circulation",
-        "info": "Cardiovascular disease is the leading cause of death worldwide. Prevention is key.",
-        "types": ["Coronary artery disease", "Heart attack", "Stroke", "Heart failure", "Arrhythmias"],
-        "risk_factors": ["High blood pressure", "High cholesterol", "Smoking", "Diabetes", "Obesity", "Physical inactivity", "Family history"],
-        "symptoms": ["Chest pain", "Shortness of breath", "Irregular heartbeat", "Fatigue", "Dizziness"],
-        "prevention": ["Regular exercise (150min/week)", "Mediterranean diet", "Manage stress", "Quit smoking", "Control blood pressure", "Manage weight"],
-        "screening": "Blood pressure checks, cholesterol tests, EKG for high-risk groups",
-        "stats": "1 in 5 deaths caused by heart disease; 1 death every 34 seconds"
-    },
-    
-    "hypertension": {
-        "title": "Hypertension (High Blood Pressure)",
-        "category": "Heart & Circulation",
-        "info": "Persistent elevated blood pressure (≥140/90 mmHg) increases heart disease and stroke risk.",
-        "blood_pressure_ranges": [
-            "Normal: <120/80 mmHg",
-            "Elevated: 120-129/<80 mmHg",
-            "Stage 1: 130-139/80-89 mmHg",
-            "Stage 2: ≥140/90 mmHg"
-        ],
-        "symptoms": ["Usually asymptomatic", "Headaches", "Shortness of breath", "Nosebleeds"],
-        "complications": ["Heart disease", "Stroke", "Kidney damage", "Vision problems"],
-        "management": [
-            "Reduce sodium (<2,300mg/day)",
-            "Regular exercise",
-            "Maintain healthy weight",
-            "DASH diet",
-            "Limit alcohol",
-            "Manage stress",
-            "Medication if needed"
-        ],
-        "monitoring": "Check BP regularly; home monitoring helps",
-        "stats": "Affects 1.13 billion people; Leading cause of preventable deaths"
-    },
-    
-    "cholesterol_management": {
-        "title": "Cholesterol Management",
-        "category": "Heart & Circulation",
-        "info": "High cholesterol is a major risk factor for heart disease and stroke.",
-        "types": [
-            "LDL (bad): Builds up in arteries",
-            "HDL (good): Removes cholesterol",
-            "Triglycerides: Type of fat in blood",
-            "Total: All forms combined"
-        ],
-        "healthy_levels": {
-            "Total": "<200 mg/dL",
-            "LDL": "<100 mg/dL",
-            "HDL": ">40 mg/dL (men), >50 mg/dL (women)",
-            "Triglycerides": "<150 mg/dL"
-        },
-        "reduction": [
-            "Reduce saturated fat",
-            "Increase soluble fiber",
-            "Add plant sterols",
-            "Exercise regularly",
-            "Maintain healthy weight",
-            "Eat more fish/omega-3s"
-        ],
-        "screening": "Blood tests recommended for all adults",
-        "stats": "1 in 3 American adults have high cholesterol"
-    },
-    
-    # NEW TOPICS - RESPIRATORY
-    "respiratory_health": {
-        "title": "Respiratory Health & Lung Disease",
-        "category": "Lungs & Breathing",
-        "info": "Chronic respiratory diseases affect millions worldwide. Prevention and early detection are critical.",
-        "conditions": [
-            "COPD: Chronic obstructive pulmonary disease",
-            "Asthma: Airway inflammation",
-            "Bronchitis: Airway inflammation",
-            "Emphysema: Lung tissue damage",
-            "Cystic fibrosis: Genetic disorder"
-        ],
-        "symptoms": ["Chronic cough", "Shortness of breath", "Chest tightness", "Wheezing", "Mucus production"],
-        "prevention": [
-            "Don't smoke",
-            "Avoid secondhand smoke",
-            "Avoid air pollution",
-            "Regular exercise",
-            "Get flu/pneumonia vaccines",
-            "Avoid respiratory infections"
-        ],
-        "risk_factors": ["Smoking", "Air pollution", "Occupational exposure", "Genetic factors"],
-        "stats": "6.2M adults with chronic bronchitis; 3rd leading cause of death"
-    },
-    
-    # NEW TOPICS - CANCER
-    "cancer_prevention": {
-        "title": "Cancer Prevention & Screening",
-        "category": "Disease Prevention",
-        "info": "Cancer is the 2nd leading cause of death. Prevention and early detection save lives.",
-        "common_types": [
-            "Breast cancer: 1 in 8 women lifetime risk",
-            "Prostate cancer: Most common in men",
-            "Lung cancer: Leading cancer death",
-            "Colorectal cancer: Highly preventable",
-            "Skin cancer: Most common but preventable"
-        ],
-        "prevention": [
-            "Avoid tobacco and secondhand smoke",
-            "Limit alcohol (≤1 drink/day women, ≤2 men)",
-            "Sun protection (SPF 30+, limit 10am-4pm)",
-            "Healthy weight",
-            "Regular exercise",
-            "Healthy diet (fruits, veggies, whole grains)",
-            "Regular screening"
-        ],
-        "screening": [
-            "Mammograms (women 40+)",
-            "PSA tests (men 50+)",
-            "Colonoscopies (adults 45+)",
-            "Pap smears (women 21+)",
-            "Skin checks (regular)"
-        ],
-        "stats": "1 in 3 Americans diagnosed with cancer; 80% preventable with lifestyle changes"
-    },
-    
-    # NEW TOPICS - BONE HEALTH
-    "bone_health": {
-        "title": "Bone Health & Osteoporosis Prevention",
-        "category": "Musculoskeletal",
-        "info": "Strong bones are essential for mobility and independence throughout life.",
-        "bone_disorders": [
-            "Osteoporosis: Low bone density",
-            "Osteopenia: Precursor to osteoporosis",
-            "Fractures: Breaks in bones",
-            "Arthritis: Joint inflammation"
-        ],
-        "risk_factors": ["Age", "Gender (women more at risk)", "Family history", "Low calcium/vitamin D", "Sedentary lifestyle", "Smoking"],
-        "prevention": [
-            "Adequate calcium (1000-1200mg/day)",
-            "Vitamin D (600-800 IU/day)",
-            "Weight-bearing exercise",
-            "Strength training",
-            "Avoid smoking",
-            "Limit alcohol",
-            "Regular screening (women 65+)"
-        ],
-        "best_calcium_sources": ["Dairy products", "Leafy greens", "Fish with bones", "Fortified foods"],
-        "stats": "1 in 3 people over 50 have osteoporosis; Preventable in 80% of cases"
-    },
-    
-    # NEW TOPICS - IMMUNE HEALTH
-    "immune_system_health": {
-        "title": "Immune System Health & Strength",
-        "category": "Immune System",
-        "info": "A strong immune system protects against infections and diseases.",
-        "immune_boosters": [
-            "Sleep: 7-9 hours nightly",
-            "Exercise: 150 min/week moderate activity",
-            "Nutrition: Fruits, veggies, proteins",
-            "Stress management: Meditation, yoga",
-            "Hydration: 2-3 liters water daily",
-            "Social connections: Reduces stress",
-            "Hygiene: Hand washing, cleanliness"
-        ],
-        "key_nutrients": [
-            "Vitamin C: Citrus, berries, peppers",
-            "Vitamin D: Sunlight, fatty fish",
-            "Zinc: Nuts, seeds, shellfish",
-            "Selenium: Brazil nuts, fish",
-            "Probiotics: Yogurt, fermented foods"
-        ],
-        "avoid": ["Excessive alcohol", "Smoking", "Chronic stress", "Poor sleep", "Sedentary lifestyle"],
-        "vaccination": "Staying current with vaccines strengthens immunity",
-        "stats": "Lifestyle changes improve immune function by 30-50%"
-    },
-    
-    # NEW TOPICS - DIGESTIVE HEALTH
-    "digestive_health": {
-        "title": "Digestive Health & Gut Wellness",
-        "category": "Digestive System",
-        "info": "Healthy digestion is crucial for nutrient absorption and overall wellness.",
-        "common_issues": [
-            "IBS: Irritable Bowel Syndrome",
-            "GERD: Acid reflux",
-            "Celiac disease: Gluten sensitivity",
-            "Crohn's disease: Inflammatory bowel",
-            "Constipation: Difficulty passing stool"
-        ],
-        "gut_health_tips": [
-            "Eat high-fiber foods",
-            "Stay hydrated",
-            "Eat fermented foods (probiotics)",
-            "Reduce processed foods",
-            "Chew thoroughly",
-            "Exercise regularly",
-            "Manage stress",
-            "Regular meal times"
-        ],
-        "fiber_sources": ["Whole grains", "Legumes", "Fruits", "Vegetables", "Nuts and seeds"],
-        "foods_to_limit": ["Processed foods", "High fat", "Excess sugar", "Spicy (if sensitive)"],
-        "stats": "70% of immune system in gut; Healthy microbiome prevents disease"
-    },
-    
-    # NEW TOPICS - SKIN HEALTH
-    "skin_health": {
-        "title": "Skin Health & Dermatology",
-        "category": "Skin Care",
-        "info": "Healthy skin is a reflection of overall health and requires proper care.",
-        "skin_conditions": [
-            "Acne: Blocked pores, bacteria",
-            "Eczema: Chronic inflammation",
-            "Psoriasis: Accelerated cell growth",
-            "Dermatitis: Skin irritation",
-            "Skin cancer: Melanoma, carcinoma"
-        ],
-        "skin_care_routine": [
-            "Cleanse twice daily",
-            "Moisturize daily",
-            "Use sunscreen (SPF 30+) daily",
-            "Exfoliate 1-2 times weekly",
-            "Stay hydrated (water)",
-            "Get enough sleep",
-            "Manage stress"
-        ],
-        "sun_protection": [
-            "SPF 30+ daily",
-            "Reapply every 2 hours",
-            "Avoid sun 10am-4pm",
-            "Wear protective clothing",
-            "Wear sunglasses",
-            "Check skin regularly"
-        ],
-        "stats": "1 in 5 Americans get skin cancer; 90% preventable with sun protection"
-    },
-    
-    # NEW TOPICS - EXERCISE & FITNESS
-    "exercise_fitness": {
-        "title": "Exercise & Physical Fitness",
-        "category": "Lifestyle",
-        "info": "Regular physical activity is one of the most important health behaviors.",
-        "exercise_types": [
-            "Cardio: 150 min/week moderate intensity",
-            "Strength: 2-3 sessions/week",
-            "Flexibility: Daily stretching",
-            "Balance: Especially as we age"
-        ],
-        "health_benefits": [
-            "Reduces heart disease risk by 35%",
-            "Prevents diabetes by 40%",
-            "Improves mental health (30% reduction in depression)",
-            "Strengthens bones and muscles",
-            "Improves sleep quality",
-            "Increases energy and mood"
-        ],
-        "getting_started": [
-            "Start with 10 minutes daily",
-            "Choose activities you enjoy",
-            "Progress gradually",
-            "Find accountability partner",
-            "Schedule workouts like appointments",
-            "Vary activities to prevent boredom"
-        ],
-        "barriers_and_solutions": [
-            "No time → Schedule 10 min morning walks",
-            "Too expensive → Free online videos",
-            "Injured → Water exercise, tai chi",
-            "Unmotivated → Group classes, apps"
-        ],
-        "stats": "Regular exercise adds 7-10 years to lifespan"
-    }
-}
-
-# ============================================
-# EXPANDED QUIZ DATABASE (Multiple questions per topic)
-# ============================================
+        results = {}
+        for name, future in futures.items():
+            label = sources[name][0]
+            if future.cancelled() or not future.done():
+                results[name] = {"status": "error", "message": f"{label} timed out after {SEARCH_TIMEOUT} s"}
+            elif future.exception() is not None:
+                results[name] = {"status": "error", "message": f"{label} failed: {future.exception()}"}
+            else:
+                results[name] = future.result()
+        return results
 
-QUIZ_QUESTIONS = {
-    "diabetes": [
-        {
-            "q": "What is the normal fasting blood glucose level?",
-            "opts": ["Less than 100 mg/dL", "100-125 mg/dL", "More than 125 mg/dL"],
-            "ans": 0,
-            "exp": "Normal is <100 mg/dL. 100-125 indicates prediabetes. >125 indicates diabetes."
-        },
-        {
-            "q": "Type 1 diabetes is primarily caused by:",
-            "opts": ["Lifestyle factors", "Autoimmune attack on insulin cells", "Poor diet"],
-            "ans": 1,
-            "exp": "Type 1 is autoimmune - the body attacks insulin-producing pancreatic cells."
-        },
-        {
-            "q": "Which is the most common type of diabetes?",
-            "opts": ["Type 1", "Type 2", "Gestational"],
-            "ans": 1,
-            "exp": "Type 2 accounts for 90-95% of all diabetes cases."
-        },
-        {
-            "q": "How much exercise per week is recommended for diabetes management?",
-            "opts": ["30 minutes total", "150 minutes moderate", "300 minutes"],
-            "ans": 1,
-            "exp": "150 minutes of moderate-intensity exercise weekly helps manage blood sugar."
-        }
-    ],
-    
-    "cardiovascular_health": [
-        {
-            "q": "What is the leading cause of death worldwide?",
-            "opts": ["Cancer", "Cardiovascular disease", "Respiratory disease"],
-            "ans": 1,
-            "exp": "Cardiovascular disease (heart attack, stroke) is the #1 cause of death globally."
-        },
-        {
-            "q": "Which blood pressure reading indicates hypertension (Stage 2)?",
-            "opts": ["120/80", "130/85", "≥140/90"],
-            "ans": 2,
-            "exp": "Stage 2 hypertension starts at 140/90 mmHg and requires treatment."
-        },
-        {
-            "q": "How much physical activity reduces heart disease risk?",
-            "opts": ["10 minutes/week", "75 minutes vigorous/week", "5 hours/week"],
-            "ans": 1,
-            "exp": "150 min moderate or 75 min vigorous weekly reduces heart disease by 35%."
-        }
-    ],
-    
-    "cancer_prevention": [
-        {
-            "q": "What percentage of cancers are preventable?",
-            "opts": ["30%", "50%", "80%"],
-            "ans": 2,
-            "exp": "80% of cancers are preventable through lifestyle changes."
-        },
-        {
-            "q": "Which is NOT a major modifiable cancer risk factor?",
-            "opts": ["Smoking", "Alcohol", "Height"],
-            "ans": 2,
-            "exp": "Height is not a cancer risk factor. Smoking and alcohol are major risk factors."
-        },
-        {
-            "q": "At what age should women begin mammogram screening?",
-            "opts": ["Age 30", "Age 40", "Age 50"],
-            "ans": 1,
-            "exp": "Women 40+ should discuss mammography with their doctor; regular screening starts at 50."
-        }
-    ],
-    
-    "bone_health": [
-        {
-            "q": "What is the recommended daily calcium intake for adults?",
-            "opts": ["500mg", "800mg", "1000-1200mg"],
-            "ans": 2,
-            "exp": "Adults need 1000-1200mg calcium daily for bone health."
-        },
-        {
-            "q": "Which vitamin is crucial for calcium absorption?",
-            "opts": ["Vitamin A", "Vitamin C", "Vitamin D"],
-            "ans": 2,
-            "exp": "Vitamin D is essential for calcium absorption in the intestines."
-        },
-        {
-            "q": "What type of exercise is best for bone health?",
-            "opts": ["Swimming", "Weight-bearing exercise", "Cycling"],
-            "ans": 1,
-            "exp": "Weight-bearing exercises (walking, jogging, strength training) build and maintain bone density."
-        }
-    ],
-    
-    "immune_system_health": [
-        {
-            "q": "What percentage of immune system is in the gut?",
-            "opts": ["30%", "50%", "70%"],
-            "ans": 2,
-            "exp": "70% of our immune system is in the gut, making digestive health crucial."
-        },
-        {
-            "q": "How much sleep boosts immune function?",
-            "opts": ["5-6 hours", "7-9 hours", "10+ hours"],
-            "ans": 1,
-            "exp": "7-9 hours of sleep strengthens immune response and disease prevention."
-        },
-        {
-            "q": "Which nutrient is critical for immune cell production?",
-            "opts": ["Fat", "Zinc", "Sugar"],
-            "ans": 1,
-            "exp": "Zinc is essential for immune cell development and function."
-        }
-    ],
-    
-    "exercise_fitness": [
-        {
-            "q": "How much moderate-intensity exercise is recommended weekly?",
-            "opts": ["75 minutes", "150 minutes", "300 minutes"],
-            "ans": 1,
-            "exp": "150 minutes of moderate-intensity aerobic activity weekly is recommended."
-        },
-        {
-            "q": "What does regular exercise reduce depression by?",
-            "opts": ["10%", "20%", "30%"],
-            "ans": 2,
-            "exp": "Regular exercise reduces depression symptoms by approximately 30%."
-        },
-        {
-            "q": "How many years can regular exercise add to lifespan?",
-            "opts": ["2-3 years", "5-7 years", "7-10 years"],
-            "ans": 2,
-            "exp": "Regular physical activity can add 7-10 years to life expectancy."
-        }
-    ]
-}
+@st.cache_resource(show_spinner=False)
+def _prewarm_research_cache() -> threading.Thread:
+    """Fetch PubMed results for every built-in topic once per process, in the background"""
+    def warm():
+        for topic in HEALTH_TOPICS:
+            HealthAPIs.get_pubmed_articles(topic)
+            time.sleep(1)  # NCBI allows 3 requests/second without an API key
+    
+    thread = threading.Thread(target=warm, name="research-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 # ============================================
 # STREAMLIT UI - ENHANCED
 # ============================================
 
 st.set_page_config(page_title="🩺 Health Bot PRO", layout="wide")
+_prewarm_research_cache()
 
 # Custom CSS
-st.markdown("""
+CSS = """
 <style>
     .metric-card { 
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -612,7 +391,8 @@ st.markdown("""
         color: white;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CSS, unsafe_allow_html=True)
 
 st.title("🩺 Health Education Bot PRO")
 st.markdown("**Evidence-based health information with Real APIs, Expanded Topics, and Advanced Quizzes**")
@@ -622,75 +402,112 @@ st.markdown("Integrated with: PubMed | CDC | NIH")
 # SESSION STATE
 # ============================================
 
-if "history" not in st.session_state:
-    st.session_state.history = []
 if "scores" not in st.session_state:
     st.session_state.scores = {}
 if "quiz_answered" not in st.session_state:
     st.session_state.quiz_answered = False
 if "current_quiz" not in st.session_state:
     st.session_state.current_quiz = None
+if "counts" not in st.session_state:
+    st.session_state.counts = {"learn": 0, "quiz": 0, "myth": 0}
+if "quiz_decks" not in st.session_state:
+    st.session_state.quiz_decks = {}
+if "last_dealt" not in st.session_state:
+    st.session_state.last_dealt = {}
+if "learn_open" not in st.session_state:
+    st.session_state.learn_open = None
+if "started_at" not in st.session_state:
+    st.session_state.started_at = datetime.now()
 
-# ============================================
-# NAVIGATION
-# ============================================
+def record_activity(kind: str):
+    """Bump the running counter the Dashboard and About panels read"""
+    st.session_state.counts[kind] += 1
 
-with st.sidebar:
-    st.title("📋 MENU")
-    mode = st.radio("Select Mode:", [
-        "📚 Learn (Topics)",
-        "🎯 Quiz (Questions)",
-        "🔍 Myths (Truth)",
-        "📊 Dashboard",
-        "🔬 Research (APIs)",
-        "ℹ️ About"
-    ])
+def draw_question(topic: str) -> QuizQuestion:
+    """Deal the next question from the topic's shuffled deck, reshuffling once every question has been seen"""
+    deck = st.session_state.quiz_decks.get(topic)
+    if not deck:
+        questions = QUIZ_QUESTIONS[topic]
+        deck = st.session_state.quiz_decks[topic] = deque(random.sample(questions, len(questions)))
+        # Don't open the new cycle with the question that closed the last one
+        if len(deck) > 1 and deck[0] == st.session_state.last_dealt.get(topic):
+            deck.rotate(-1)
+    quiz = st.session_state.last_dealt[topic] = deck.popleft()
+    return quiz
+
+def show_api_status(result: dict):
+    """Warn when an API result is an error or a stale cached copy"""
+    if result["status"] != "success":
+        retry = f" Try again in {result['retry_after']} s." if "retry_after" in result else ""
+        st.warning(f"⚠️ {result.get('message', 'Source unavailable')}{retry}")
+    elif result.get("stale"):
+        st.warning("⚠️ Source is not responding; showing cached results")
+
+def show_api_result(result: dict):
+    """Render an API result, flagging errors and stale cached copies"""
+    show_api_status(result)
+    
+    if "articles" not in result:
+        st.json(result)
+        return
+    
+    # Article lists can be long: show a trimmed table, keep the raw payload collapsed
+    summary = [
+        {"Title": a["title"], "Year": a["year"], "URL": a.get("url", "")}
+        for a in result["articles"][:10]
+    ]
+    st.dataframe(summary, use_container_width=True)
+    with st.expander("Full response"):
+        st.json(result)
+
+def clear_quiz():
+    """Drop the current question (button callback)"""
+    st.session_state.current_quiz = None
 
 # ============================================
 # MODE 1: LEARN TOPICS
 # ============================================
 
-if mode == "📚 Learn (Topics)":
+@st.fragment
+def learn_panel():
+    """Browse topics by category and read the full entry"""
     st.subheader("📚 Explore Health Topics")
     
-    # Get unique categories
-    categories = list(set([t["category"] for t in HEALTH_TOPICS.values()]))
-    
     col1, col2 = st.columns([2, 1])
     with col1:
-        category = st.selectbox("Select category:", sorted(categories))
+        category = st.selectbox("Select category:", CATEGORIES)
     with col2:
         st.markdown("")
         st.markdown("")
     
-    # Filter topics by category
-    filtered_topics = {k: v for k, v in HEALTH_TOPICS.items() if v["category"] == category}
+    filtered_topics = TOPICS_BY_CATEGORY[category]
     
     topic_names = list(filtered_topics.keys())
-    selected_topic = st.selectbox("Select topic:", topic_names, format_func=lambda x: filtered_topics[x]["title"])
+    selected_topic = st.selectbox("Select topic:", topic_names, format_func=TOPIC_TITLES.__getitem__)
     
     if st.button("📖 Read Full Information"):
+        st.session_state.learn_open = selected_topic
+        record_activity("learn")
+    
+    # Remembered in session state, so a Research Sources click doesn't close the entry
+    if st.session_state.learn_open == selected_topic:
         topic_data = filtered_topics[selected_topic]
         
         st.success(f"✅ {topic_data['title']}")
         st.write(f"**{topic_data['info']}**")
         st.write("---")
         
-        for key, value in topic_data.items():
-            if key not in ["title", "info", "category"]:
-                display_key = key.replace("_", " ").upper()
-                if isinstance(value, list):
-                    st.write(f"**{display_key}:**")
-                    for item in value:
-                        st.write(f"  • {item}")
-                else:
-                    st.write(f"**{display_key}:** {value}")
-        
-        st.session_state.history.append({
-            "type": "learn",
-            "topic": selected_topic,
-            "time": datetime.now().strftime("%H:%M")
-        })
+        # One markdown element for the whole entry instead of one per line
+        lines = []
+        for key in DISPLAY_FIELDS[selected_topic]:
+            value = topic_data[key]
+            display_key = FIELD_LABELS[key]
+            if isinstance(value, list):
+                lines.append(f"**{display_key}:**")
+                lines.extend(f"  • {item}" for item in value)
+            else:
+                lines.append(f"**{display_key}:** {value}")
+        st.markdown("\n\n".join(lines))
         
         # Show APIs
         with st.expander("🔬 Research Sources"):
@@ -698,16 +515,17 @@ if mode == "📚 Learn (Topics)":
             with col1:
                 if st.button("📄 PubMed Articles"):
                     articles = HealthAPIs.get_pubmed_articles(selected_topic)
-                    if articles["status"] == "success":
-                        for article in articles["articles"]:
-                            st.write(f"**{article['title']}**")
-                            st.write(f"*{article['authors']}*, {article['journal']} ({article['year']})")
-                            st.write(article['summary'])
-                            st.write("---")
+                    show_api_status(articles)
+                    for article in articles.get("articles", []):
+                        st.write(f"**{article['title']}**")
+                        st.write(f"*{article['authors']}*, {article['journal']} ({article['year']})")
+                        st.write(article['summary'])
+                        st.write("---")
             
             with col2:
                 if st.button("🏥 CDC Guidelines"):
                     cdc = HealthAPIs.get_cdc_data(selected_topic)
+                    show_api_status(cdc)
                     if cdc["status"] == "success":
                         st.write(f"**{cdc.get('name', 'CDC Data')}**")
                         for key, val in cdc.items():
@@ -718,126 +536,118 @@ if mode == "📚 Learn (Topics)":
 # MODE 2: QUIZ
 # ============================================
 
-elif mode == "🎯 Quiz (Questions)":
+@st.fragment
+def quiz_panel():
+    """Ask a random question for the chosen topic and score the answer"""
     st.subheader("🎯 Test Your Knowledge")
     
     available_quiz_topics = list(QUIZ_QUESTIONS.keys())
-    topic = st.selectbox("Select topic:", available_quiz_topics, format_func=lambda x: HEALTH_TOPICS[x]["title"])
+    topic = st.selectbox("Select topic:", available_quiz_topics, format_func=TOPIC_TITLES.__getitem__)
     
     if st.button("📝 Load Question"):
-        quiz = random.choice(QUIZ_QUESTIONS[topic])
+        quiz = draw_question(topic)
         st.session_state.current_quiz = quiz
         st.session_state.quiz_answered = False
-        st.rerun()
     
     if st.session_state.current_quiz:
         quiz = st.session_state.current_quiz
         
-        st.write(f"**Q: {quiz['q']}**")
+        st.write(f"**Q: {quiz.q}**")
         st.write("---")
         
         selected_idx = st.radio(
             "Your answer:",
-            range(len(quiz['opts'])),
-            format_func=lambda i: quiz['opts'][i],
+            range(len(quiz.opts)),
+            format_func=lambda i: quiz.opts[i],
             key=f"quiz_{id(quiz)}"
         )
         
         col1, col2 = st.columns(2)
         with col1:
             if st.button("✅ Submit"):
-                st.session_state.quiz_answered = True
-                is_correct = (selected_idx == quiz['ans'])
-                
-                if topic not in st.session_state.scores:
-                    st.session_state.scores[topic] = {"correct": 0, "total": 0}
+                is_correct = (selected_idx == quiz.ans)
                 
-                st.session_state.scores[topic]["total"] += 1
-                if is_correct:
-                    st.session_state.scores[topic]["correct"] += 1
+                # Read once, update locally, write back once
+                scores = st.session_state.scores
+                score = scores.get(topic, {"correct": 0, "total": 0})
+                scores[topic] = {
+                    "correct": score["correct"] + is_correct,
+                    "total": score["total"] + 1
+                }
+                st.session_state.update({"quiz_answered": True, "quiz_correct": is_correct})
                 
-                st.session_state.history.append({
-                    "type": "quiz",
-                    "topic": topic,
-                    "correct": is_correct,
-                    "time": datetime.now().strftime("%H:%M")
-                })
-                
-                st.rerun()
+                record_activity("quiz")
         
         with col2:
-            if st.button("🔄 Next"):
-                st.session_state.current_quiz = None
-                st.rerun()
+            # Cleared in a callback, so this run already renders without the old question
+            st.button("🔄 Next", on_click=clear_quiz)
         
         if st.session_state.quiz_answered:
             st.write("---")
-            is_correct = (selected_idx == quiz['ans'])
-            if is_correct:
+            if st.session_state.quiz_correct:
                 st.success("🎉 Correct!")
             else:
-                st.error(f"❌ Wrong! Answer: {quiz['opts'][quiz['ans']]}")
-            st.info(f"💡 {quiz['exp']}")
+                st.error(f"❌ Wrong! Answer: {quiz.opts[quiz.ans]}")
+            st.info(f"💡 {quiz.exp}")
 
 # ============================================
 # MODE 3: MYTHS
 # ============================================
 
-elif mode == "🔍 Myths (Truth)":
+@st.fragment
+def myths_panel():
+    """Show the evidence behind a common health myth"""
     st.subheader("🔍 Bust Health Myths")
     
-    myths_data = {
-        "cold": ("Exposure to cold causes colds", "Viruses cause colds, not temperature"),
-        "sugar": ("Sugar makes children hyperactive", "No scientific link found"),
-        "vitamin": ("Vitamin C prevents colds", "Extra vitamin C doesn't prevent colds"),
-        "water": ("Drink exactly 8 glasses daily", "Needs vary by person"),
-        "knuckles": ("Cracking knuckles causes arthritis", "No link found")
-    }
-    
-    selected_myth = st.selectbox("Select myth:", list(myths_data.keys()), format_func=lambda x: myths_data[x][0])
+    selected_idx = st.selectbox("Select myth:", range(len(MYTH_KEYS)), format_func=MYTH_CLAIMS.__getitem__)
     
     if st.button("💣 Bust This Myth"):
-        myth, truth = myths_data[selected_myth]
         col1, col2 = st.columns(2)
         with col1:
-            st.error(f"❌ **MYTH:** {myth}")
+            st.error(f"❌ **MYTH:** {MYTH_CLAIMS[selected_idx]}")
         with col2:
-            st.success(f"✅ **TRUTH:** {truth}")
-        st.session_state.history.append({"type": "myth", "myth": selected_myth})
+            st.success(f"✅ **TRUTH:** {MYTH_TRUTHS[selected_idx]}")
+        record_activity("myth")
 
 # ============================================
 # MODE 4: DASHBOARD
 # ============================================
 
-elif mode == "📊 Dashboard":
+def dashboard_panel():
+    """Summarize session activity and quiz scores"""
     st.subheader("📊 Your Progress")
     
+    counts = st.session_state.counts
+    
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Activities", len(st.session_state.history))
-    col2.metric("Topics Learned", len([h for h in st.session_state.history if h["type"] == "learn"]))
-    col3.metric("Quizzes Taken", len([h for h in st.session_state.history if h["type"] == "quiz"]))
-    col4.metric("Myths Checked", len([h for h in st.session_state.history if h["type"] == "myth"]))
+    col1.metric("Total Activities", sum(counts.values()))
+    col2.metric("Topics Learned", counts["learn"])
+    col3.metric("Quizzes Taken", counts["quiz"])
+    col4.metric("Myths Checked", counts["myth"])
     
     st.write("---")
     
-    if st.session_state.scores:
+    score_data = [
+        {
+            "Topic": TOPIC_TITLES[topic],
+            "Correct": scores["correct"],
+            "Total": scores["total"],
+            "Score": f"{scores['correct'] / scores['total'] * 100:.0f}%"
+        }
+        for topic, scores in st.session_state.scores.items()
+        if scores["total"]
+    ]
+    if score_data:
         st.subheader("🎯 Quiz Scores by Topic")
-        score_data = []
-        for topic, scores in st.session_state.scores.items():
-            pct = (scores["correct"] / scores["total"] * 100) if scores["total"] > 0 else 0
-            score_data.append({
-                "Topic": HEALTH_TOPICS[topic]["title"],
-                "Correct": scores["correct"],
-                "Total": scores["total"],
-                "Score": f"{pct:.0f}%"
-            })
         st.dataframe(score_data, use_container_width=True)
 
 # ============================================
 # MODE 5: RESEARCH APIs
 # ============================================
 
-elif mode == "🔬 Research (APIs)":
+@st.fragment
+def research_panel():
+    """Query the PubMed, CDC and NIH integrations directly"""
     st.subheader("🔬 Research & External Resources")
     
     st.write("**This bot integrates with:**")
@@ -845,79 +655,118 @@ elif mode == "🔬 Research (APIs)":
     st.write("- 🏥 **CDC** - Disease prevention guidelines")
     st.write("- 🏛️ **NIH** - Health resources")
     
-    search_topic = st.text_input("Search for research:")
+    search_topic = st.text_input("Search for research:").strip()
+    if not search_topic:
+        # return, not st.stop(): stopping here would also skip the footer
+        st.info("Enter a topic first")
+        return
+    
+    results = {}
+    if st.button("🔎 Search All Sources"):
+        results = HealthAPIs.search_all(search_topic)
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
         if st.button("📄 PubMed Search"):
-            result = HealthAPIs.get_pubmed_articles(search_topic)
-            st.json(result)
+            results["pubmed"] = HealthAPIs.get_pubmed_articles(search_topic)
+        if "pubmed" in results:
+            show_api_result(results["pubmed"])
     
     with col2:
         if st.button("🏥 CDC Data"):
-            result = HealthAPIs.get_cdc_data(search_topic)
-            st.json(result)
+            results["cdc"] = HealthAPIs.get_cdc_data(search_topic)
+        if "cdc" in results:
+            show_api_result(results["cdc"])
     
     with col3:
         if st.button("🏛️ NIH Resources"):
-            result = HealthAPIs.get_nih_resources(search_topic)
-            st.json(result)
+            results["nih"] = HealthAPIs.get_nih_resources(search_topic)
+        if "nih" in results:
+            show_api_result(results["nih"])
 
 # ============================================
 # MODE 6: ABOUT
 # ============================================
 
-elif mode == "ℹ️ About":
+ABOUT_MD = """
+## 🩺 Health Education Bot PRO
+
+An AI-powered health educator with:
+
+### 📚 Features
+- **15+ Health Topics** across 8 categories
+- **60+ Quiz Questions** with multiple difficulty levels
+- **Real API Integration** (PubMed, CDC, NIH)
+- **Myth Busting** - Evidence-based corrections
+- **Progress Tracking** - Dashboard and statistics
+- **Research Sources** - Links to authoritative sources
+
+### 📊 Topics Covered
+- Metabolic: Diabetes, Nutrition
+- Cardiovascular: Heart disease, Hypertension, Cholesterol
+- Respiratory: Lung health, COPD
+- Prevention: Cancer, Vaccines
+- Lifestyle: Sleep, Exercise, Skin health
+- Mental Health & Wellness
+- Immune System & Digestive Health
+- Bone Health
+
+### ⚠️ Disclaimer
+This is **educational content only**. Not a substitute for professional medical advice.
+**Always consult a healthcare provider** for medical concerns.
+
+### 🔬 Data Sources
+- CDC (Centers for Disease Control)
+- NIH (National Institutes of Health)
+- PubMed (Medical research database)
+- WHO (World Health Organization)
+
+### 📝 Session Info
+"""
+
+def about_panel():
+    """Describe the bot, its sources and the medical disclaimer"""
     st.subheader("ℹ️ About This Bot")
     
-    st.write("""
-    ## 🩺 Health Education Bot PRO
-    
-    An AI-powered health educator with:
-    
-    ### 📚 Features
-    - **15+ Health Topics** across 8 categories
-    - **60+ Quiz Questions** with multiple difficulty levels
-    - **Real API Integration** (PubMed, CDC, NIH)
-    - **Myth Busting** - Evidence-based corrections
-    - **Progress Tracking** - Dashboard and statistics
-    - **Research Sources** - Links to authoritative sources
-    
-    ### 📊 Topics Covered
-    - Metabolic: Diabetes, Nutrition
-    - Cardiovascular: Heart disease, Hypertension, Cholesterol
-    - Respiratory: Lung health, COPD
-    - Prevention: Cancer, Vaccines
-    - Lifestyle: Sleep, Exercise, Skin health
-    - Mental Health & Wellness
-    - Immune System & Digestive Health
-    - Bone Health
-    
-    ### ⚠️ Disclaimer
-    This is **educational content only**. Not a substitute for professional medical advice.
-    **Always consult a healthcare provider** for medical concerns.
-    
-    ### 🔬 Data Sources
-    - CDC (Centers for Disease Control)
-    - NIH (National Institutes of Health)
-    - PubMed (Medical research database)
-    - WHO (World Health Organization)
-    
-    ### 📝 Session Info
-    Session started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    Total activities: {len(st.session_state.history)}
-    """)
+    st.write(ABOUT_MD)
+    st.caption(
+        f"Session started: {st.session_state.started_at:%Y-%m-%d %H:%M:%S} · "
+        f"Total activities: {sum(st.session_state.counts.values())}"
+    )
+
+# ============================================
+# NAVIGATION
+# ============================================
+
+# Menu labels and their panels in one place; the radio lists them in this order.
+# Widgets inside a fragment only rerun their own panel, not the whole script
+MODES = {
+    "📚 Learn (Topics)": learn_panel,
+    "🎯 Quiz (Questions)": quiz_panel,
+    "🔍 Myths (Truth)": myths_panel,
+    "📊 Dashboard": dashboard_panel,
+    "🔬 Research (APIs)": research_panel,
+    "ℹ️ About": about_panel
+}
+
+with st.sidebar:
+    st.title("📋 MENU")
+    mode = st.radio("Select Mode:", tuple(MODES))
+
+MODES[mode]()
 
 # ============================================
 # FOOTER
 # ============================================
 
-st.markdown("---")
-st.markdown("""
+FOOTER_HTML = """
 <div style='text-align: center; color: gray; font-size: 0.85em;'>
 🩺 Health Education Bot PRO | Powered by ADK & Real Health APIs<br>
 ⚠️ Educational content only. Consult healthcare providers for medical advice.<br>
 📚 15+ Topics | 60+ Quiz Questions | Real API Integration
 </div>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown("---")
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
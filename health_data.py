@@ -0,0 +1,515 @@
+# Health Education Bot - STATIC CONTENT
+# Topics, quizzes and myths, plus the indexes derived from them.
+# Streamlit re-executes app.py on every rerun; this module is imported once
+# per process (from cached bytecode), so none of it is rebuilt per interaction.
+
+from typing import NamedTuple
+
+# ============================================
+# EXPANDED HEALTH TOPICS DATABASE
+# ============================================
+
+HEALTH_TOPICS = {
+    # ORIGINAL TOPICS
+    "diabetes": {
+        "title": "Diabetes Mellitus",
+        "category": "Metabolic Disorders",
+        "info": "Chronic condition affecting blood glucose regulation. Type 1 is autoimmune, Type 2 is lifestyle-related.",
+        "types": ["Type 1: Autoimmune condition", "Type 2: Most common", "Gestational: During pregnancy"],
+        "symptoms": ["Increased thirst", "Frequent urination", "Fatigue", "Blurred vision", "Slow wound healing"],
+        "mgmt": ["Regular exercise (150 min/week)", "Healthy diet (low glycemic)", "Weight management", "Medication", "Regular monitoring"],
+        "prevention": "Maintain healthy weight, regular exercise, balanced diet, limit sugars",
+        "stats": "Affects 1 in 10 adults; 463 million people worldwide"
+    },
+    "vaccines": {
+        "title": "Vaccines & Immunization",
+        "category": "Prevention",
+        "info": "Medical preparations that train immune system to fight diseases.",
+        "types": ["Live attenuated", "Inactivated", "mRNA", "Subunit", "Toxoid"],
+        "benefits": ["Prevent serious diseases", "Reduce transmission", "Enable herd immunity", "Prevent complications"],
+        "how": ["Introduce antigen safely", "Immune system responds", "Create memory cells", "Future protection"],
+        "safety": "Rigorous testing; side effects mild/temporary; serious reactions extremely rare",
+        "stats": "Save 2-3 million lives annually; Prevent 21-14 million deaths over lifetime"
+    },
+    "nutrition": {
+        "title": "Nutrition & Healthy Eating",
+        "category": "Lifestyle",
+        "info": "Science of food and its effect on health.",
+        "food_groups": ["Fruits/veggies: 5+ daily", "Whole grains: 3+ daily", "Protein: Lean sources", "Dairy: Low-fat", "Healthy fats"],
+        "nutrients": ["Carbs (45-65%): Energy", "Protein (10-35%): Tissues", "Fats (20-35%): Hormones"],
+        "tips": ["Eat variety of colors", "Control portions", "Limit added sugars (<10%)", "Reduce sodium (<2,300mg)", "Stay hydrated"],
+        "prevention": "Prevents 40% of chronic diseases",
+        "stats": "Poor diet linked to 11 million deaths annually"
+    },
+    "sleep": {
+        "title": "Sleep & Sleep Hygiene",
+        "category": "Lifestyle",
+        "info": "Essential physiological process for recovery and health.",
+        "recommended": "Adults: 7-9 hrs; Teens: 8-10 hrs; Children: 9-12 hrs; Infants: 12-17 hrs",
+        "stages": ["N1 (Light): Transition", "N2 (Light): Body cooling", "N3 (Deep): Restoration", "REM: Memory/dreaming"],
+        "benefits": ["Immune strength", "Memory consolidation", "Hormone regulation", "Emotional stability", "Physical repair"],
+        "tips": ["Consistent schedule", "Dark room", "Cool temp (60-67°F)", "No screens 1hr before bed", "No caffeine after 2PM"],
+        "stats": "1 in 3 adults insufficient sleep; Deprivation increases disease risk 30%"
+    },
+    "mental_health": {
+        "title": "Mental Health & Wellness",
+        "category": "Mental Health",
+        "info": "Psychological and emotional well-being crucial for overall health.",
+        "conditions": ["Depression: Persistent low mood", "Anxiety: Excessive worry", "Stress: Response to demands", "Burnout: Work exhaustion"],
+        "management": ["Professional therapy", "Exercise (30min, 5x/week)", "Meditation (10min/day)", "Social connections", "Sleep 7-9hrs"],
+        "self_care": ["Regular exercise", "Maintain relationships", "Creative hobbies", "Journaling", "Nature time"],
+        "crisis": "National Crisis Hotline: 988",
+        "stats": "1 in 5 adults experience mental illness yearly; 50% begins by age 14; 80% treatable with help"
+    },
+    
+    # NEW TOPICS - CARDIOVASCULAR
+    "cardiovascular_health": {
+        "title": "Cardiovascular Health & Disease Prevention",
+        "category": "Heart & Circulation",
+        "info": "Cardiovascular disease is the leading cause of death worldwide. Prevention is key.",
+        "types": ["Coronary artery disease", "Heart attack", "Stroke", "Heart failure", "Arrhythmias"],
+        "risk_factors": ["High blood pressure", "High cholesterol", "Smoking", "Diabetes", "Obesity", "Physical inactivity", "Family history"],
+        "symptoms": ["Chest pain", "Shortness of breath", "Irregular heartbeat", "Fatigue", "Dizziness"],
+        "prevention": ["Regular exercise (150min/week)", "Mediterranean diet", "Manage stress", "Quit smoking", "Control blood pressure", "Manage weight"],
+        "screening": "Blood pressure checks, cholesterol tests, EKG for high-risk groups",
+        "stats": "1 in 5 deaths caused by heart disease; 1 death every 34 seconds"
+    },
+    
+    "hypertension": {
+        "title": "Hypertension (High Blood Pressure)",
+        "category": "Heart & Circulation",
+        "info": "Persistent elevated blood pressure (≥140/90 mmHg) increases heart disease and stroke risk.",
+        "blood_pressure_ranges": [
+            "Normal: <120/80 mmHg",
+            "Elevated: 120-129/<80 mmHg",
+            "Stage 1: 130-139/80-89 mmHg",
+            "Stage 2: ≥140/90 mmHg"
+        ],
+        "symptoms": ["Usually asymptomatic", "Headaches", "Shortness of breath", "Nosebleeds"],
+        "complications": ["Heart disease", "Stroke", "Kidney damage", "Vision problems"],
+        "management": [
+            "Reduce sodium (<2,300mg/day)",
+            "Regular exercise",
+            "Maintain healthy weight",
+            "DASH diet",
+            "Limit alcohol",
+            "Manage stress",
+            "Medication if needed"
+        ],
+        "monitoring": "Check BP regularly; home monitoring helps",
+        "stats": "Affects 1.13 billion people; Leading cause of preventable deaths"
+    },
+    
+    "cholesterol_management": {
+        "title": "Cholesterol Management",
+        "category": "Heart & Circulation",
+        "info": "High cholesterol is a major risk factor for heart disease and stroke.",
+        "types": [
+            "LDL (bad): Builds up in arteries",
+            "HDL (good): Removes cholesterol",
+            "Triglycerides: Type of fat in blood",
+            "Total: All forms combined"
+        ],
+        "healthy_levels": {
+            "Total": "<200 mg/dL",
+            "LDL": "<100 mg/dL",
+            "HDL": ">40 mg/dL (men), >50 mg/dL (women)",
+            "Triglycerides": "<150 mg/dL"
+        },
+        "reduction": [
+            "Reduce saturated fat",
+            "Increase soluble fiber",
+            "Add plant sterols",
+            "Exercise regularly",
+            "Maintain healthy weight",
+            "Eat more fish/omega-3s"
+        ],
+        "screening": "Blood tests recommended for all adults",
+        "stats": "1 in 3 American adults have high cholesterol"
+    },
+    
+    # NEW TOPICS - RESPIRATORY
+    "respiratory_health": {
+        "title": "Respiratory Health & Lung Disease",
+        "category": "Lungs & Breathing",
+        "info": "Chronic respiratory diseases affect millions worldwide. Prevention and early detection are critical.",
+        "conditions": [
+            "COPD: Chronic obstructive pulmonary disease",
+            "Asthma: Airway inflammation",
+            "Bronchitis: Airway inflammation",
+            "Emphysema: Lung tissue damage",
+            "Cystic fibrosis: Genetic disorder"
+        ],
+        "symptoms": ["Chronic cough", "Shortness of breath", "Chest tightness", "Wheezing", "Mucus production"],
+        "prevention": [
+            "Don't smoke",
+            "Avoid secondhand smoke",
+            "Avoid air pollution",
+            "Regular exercise",
+            "Get flu/pneumonia vaccines",
+            "Avoid respiratory infections"
+        ],
+        "risk_factors": ["Smoking", "Air pollution", "Occupational exposure", "Genetic factors"],
+        "stats": "6.2M adults with chronic bronchitis; 3rd leading cause of death"
+    },
+    
+    # NEW TOPICS - CANCER
+    "cancer_prevention": {
+        "title": "Cancer Prevention & Screening",
+        "category": "Disease Prevention",
+        "info": "Cancer is the 2nd leading cause of death. Prevention and early detection save lives.",
+        "common_types": [
+            "Breast cancer: 1 in 8 women lifetime risk",
+            "Prostate cancer: Most common in men",
+            "Lung cancer: Leading cancer death",
+            "Colorectal cancer: Highly preventable",
+            "Skin cancer: Most common but preventable"
+        ],
+        "prevention": [
+            "Avoid tobacco and secondhand smoke",
+            "Limit alcohol (≤1 drink/day women, ≤2 men)",
+            "Sun protection (SPF 30+, limit 10am-4pm)",
+            "Healthy weight",
+            "Regular exercise",
+            "Healthy diet (fruits, veggies, whole grains)",
+            "Regular screening"
+        ],
+        "screening": [
+            "Mammograms (women 40+)",
+            "PSA tests (men 50+)",
+            "Colonoscopies (adults 45+)",
+            "Pap smears (women 21+)",
+            "Skin checks (regular)"
+        ],
+        "stats": "1 in 3 Americans diagnosed with cancer; 80% preventable with lifestyle changes"
+    },
+    
+    # NEW TOPICS - BONE HEALTH
+    "bone_health": {
+        "title": "Bone Health & Osteoporosis Prevention",
+        "category": "Musculoskeletal",
+        "info": "Strong bones are essential for mobility and independence throughout life.",
+        "bone_disorders": [
+            "Osteoporosis: Low bone density",
+            "Osteopenia: Precursor to osteoporosis",
+            "Fractures: Breaks in bones",
+            "Arthritis: Joint inflammation"
+        ],
+        "risk_factors": ["Age", "Gender (women more at risk)", "Family history", "Low calcium/vitamin D", "Sedentary lifestyle", "Smoking"],
+        "prevention": [
+            "Adequate calcium (1000-1200mg/day)",
+            "Vitamin D (600-800 IU/day)",
+            "Weight-bearing exercise",
+            "Strength training",
+            "Avoid smoking",
+            "Limit alcohol",
+            "Regular screening (women 65+)"
+        ],
+        "best_calcium_sources": ["Dairy products", "Leafy greens", "Fish with bones", "Fortified foods"],
+        "stats": "1 in 3 people over 50 have osteoporosis; Preventable in 80% of cases"
+    },
+    
+    # NEW TOPICS - IMMUNE HEALTH
+    "immune_system_health": {
+        "title": "Immune System Health & Strength",
+        "category": "Immune System",
+        "info": "A strong immune system protects against infections and diseases.",
+        "immune_boosters": [
+            "Sleep: 7-9 hours nightly",
+            "Exercise: 150 min/week moderate activity",
+            "Nutrition: Fruits, veggies, proteins",
+            "Stress management: Meditation, yoga",
+            "Hydration: 2-3 liters water daily",
+            "Social connections: Reduces stress",
+            "Hygiene: Hand washing, cleanliness"
+        ],
+        "key_nutrients": [
+            "Vitamin C: Citrus, berries, peppers",
+            "Vitamin D: Sunlight, fatty fish",
+            "Zinc: Nuts, seeds, shellfish",
+            "Selenium: Brazil nuts, fish",
+            "Probiotics: Yogurt, fermented foods"
+        ],
+        "avoid": ["Excessive alcohol", "Smoking", "Chronic stress", "Poor sleep", "Sedentary lifestyle"],
+        "vaccination": "Staying current with vaccines strengthens immunity",
+        "stats": "Lifestyle changes improve immune function by 30-50%"
+    },
+    
+    # NEW TOPICS - DIGESTIVE HEALTH
+    "digestive_health": {
+        "title": "Digestive Health & Gut Wellness",
+        "category": "Digestive System",
+        "info": "Healthy digestion is crucial for nutrient absorption and overall wellness.",
+        "common_issues": [
+            "IBS: Irritable Bowel Syndrome",
+            "GERD: Acid reflux",
+            "Celiac disease: Gluten sensitivity",
+            "Crohn's disease: Inflammatory bowel",
+            "Constipation: Difficulty passing stool"
+        ],
+        "gut_health_tips": [
+            "Eat high-fiber foods",
+            "Stay hydrated",
+            "Eat fermented foods (probiotics)",
+            "Reduce processed foods",
+            "Chew thoroughly",
+            "Exercise regularly",
+            "Manage stress",
+            "Regular meal times"
+        ],
+        "fiber_sources": ["Whole grains", "Legumes", "Fruits", "Vegetables", "Nuts and seeds"],
+        "foods_to_limit": ["Processed foods", "High fat", "Excess sugar", "Spicy (if sensitive)"],
+        "stats": "70% of immune system in gut; Healthy microbiome prevents disease"
+    },
+    
+    # NEW TOPICS - SKIN HEALTH
+    "skin_health": {
+        "title": "Skin Health & Dermatology",
+        "category": "Skin Care",
+        "info": "Healthy skin is a reflection of overall health and requires proper care.",
+        "skin_conditions": [
+            "Acne: Blocked pores, bacteria",
+            "Eczema: Chronic inflammation",
+            "Psoriasis: Accelerated cell growth",
+            "Dermatitis: Skin irritation",
+            "Skin cancer: Melanoma, carcinoma"
+        ],
+        "skin_care_routine": [
+            "Cleanse twice daily",
+            "Moisturize daily",
+            "Use sunscreen (SPF 30+) daily",
+            "Exfoliate 1-2 times weekly",
+            "Stay hydrated (water)",
+            "Get enough sleep",
+            "Manage stress"
+        ],
+        "sun_protection": [
+            "SPF 30+ daily",
+            "Reapply every 2 hours",
+            "Avoid sun 10am-4pm",
+            "Wear protective clothing",
+            "Wear sunglasses",
+            "Check skin regularly"
+        ],
+        "stats": "1 in 5 Americans get skin cancer; 90% preventable with sun protection"
+    },
+    
+    # NEW TOPICS - EXERCISE & FITNESS
+    "exercise_fitness": {
+        "title": "Exercise & Physical Fitness",
+        "category": "Lifestyle",
+        "info": "Regular physical activity is one of the most important health behaviors.",
+        "exercise_types": [
+            "Cardio: 150 min/week moderate intensity",
+            "Strength: 2-3 sessions/week",
+            "Flexibility: Daily stretching",
+            "Balance: Especially as we age"
+        ],
+        "health_benefits": [
+            "Reduces heart disease risk by 35%",
+            "Prevents diabetes by 40%",
+            "Improves mental health (30% reduction in depression)",
+            "Strengthens bones and muscles",
+            "Improves sleep quality",
+            "Increases energy and mood"
+        ],
+        "getting_started": [
+            "Start with 10 minutes daily",
+            "Choose activities you enjoy",
+            "Progress gradually",
+            "Find accountability partner",
+            "Schedule workouts like appointments",
+            "Vary activities to prevent boredom"
+        ],
+        "barriers_and_solutions": [
+            "No time → Schedule 10 min morning walks",
+            "Too expensive → Free online videos",
+            "Injured → Water exercise, tai chi",
+            "Unmotivated → Group classes, apps"
+        ],
+        "stats": "Regular exercise adds 7-10 years to lifespan"
+    }
+}
+
+# Category index, so the Learn panel never rescans HEALTH_TOPICS
+TOPICS_BY_CATEGORY = {}
+for key, topic in HEALTH_TOPICS.items():
+    TOPICS_BY_CATEGORY.setdefault(topic["category"], {})[key] = topic
+CATEGORIES = sorted(TOPICS_BY_CATEGORY)
+
+# Selectbox labels, passed as format_func=TOPIC_TITLES.__getitem__
+TOPIC_TITLES = {key: topic["title"] for key, topic in HEALTH_TOPICS.items()}
+
+# Fields the Learn panel renders for each topic, in definition order
+DISPLAY_FIELDS = {
+    key: tuple(field for field in topic if field not in ("title", "info", "category"))
+    for key, topic in HEALTH_TOPICS.items()
+}
+
+# Display label for every topic field, e.g. "risk_factors" -> "RISK FACTORS"
+FIELD_LABELS = {key: key.replace("_", " ").upper() for t in HEALTH_TOPICS.values() for key in t}
+
+# ============================================
+# EXPANDED QUIZ DATABASE (Multiple questions per topic)
+# ============================================
+
+class QuizQuestion(NamedTuple):
+    """One multiple-choice question; ans is the index of the correct option"""
+    q: str
+    opts: tuple
+    ans: int
+    exp: str
+
+QUIZ_QUESTIONS = {
+    "diabetes": [
+        QuizQuestion(
+            q="What is the normal fasting blood glucose level?",
+            opts=("Less than 100 mg/dL", "100-125 mg/dL", "More than 125 mg/dL"),
+            ans=0,
+            exp="Normal is <100 mg/dL. 100-125 indicates prediabetes. >125 indicates diabetes."
+        ),
+        QuizQuestion(
+            q="Type 1 diabetes is primarily caused by:",
+            opts=("Lifestyle factors", "Autoimmune attack on insulin cells", "Poor diet"),
+            ans=1,
+            exp="Type 1 is autoimmune - the body attacks insulin-producing pancreatic cells."
+        ),
+        QuizQuestion(
+            q="Which is the most common type of diabetes?",
+            opts=("Type 1", "Type 2", "Gestational"),
+            ans=1,
+            exp="Type 2 accounts for 90-95% of all diabetes cases."
+        ),
+        QuizQuestion(
+            q="How much exercise per week is recommended for diabetes management?",
+            opts=("30 minutes total", "150 minutes moderate", "300 minutes"),
+            ans=1,
+            exp="150 minutes of moderate-intensity exercise weekly helps manage blood sugar."
+        )
+    ],
+    
+    "cardiovascular_health": [
+        QuizQuestion(
+            q="What is the leading cause of death worldwide?",
+            opts=("Cancer", "Cardiovascular disease", "Respiratory disease"),
+            ans=1,
+            exp="Cardiovascular disease (heart attack, stroke) is the #1 cause of death globally."
+        ),
+        QuizQuestion(
+            q="Which blood pressure reading indicates hypertension (Stage 2)?",
+            opts=("120/80", "130/85", "≥140/90"),
+            ans=2,
+            exp="Stage 2 hypertension starts at 140/90 mmHg and requires treatment."
+        ),
+        QuizQuestion(
+            q="How much physical activity reduces heart disease risk?",
+            opts=("10 minutes/week", "75 minutes vigorous/week", "5 hours/week"),
+            ans=1,
+            exp="150 min moderate or 75 min vigorous weekly reduces heart disease by 35%."
+        )
+    ],
+    
+    "cancer_prevention": [
+        QuizQuestion(
+            q="What percentage of cancers are preventable?",
+            opts=("30%", "50%", "80%"),
+            ans=2,
+            exp="80% of cancers are preventable through lifestyle changes."
+        ),
+        QuizQuestion(
+            q="Which is NOT a major modifiable cancer risk factor?",
+            opts=("Smoking", "Alcohol", "Height"),
+            ans=2,
+            exp="Height is not a cancer risk factor. Smoking and alcohol are major risk factors."
+        ),
+        QuizQuestion(
+            q="At what age should women begin mammogram screening?",
+            opts=("Age 30", "Age 40", "Age 50"),
+            ans=1,
+            exp="Women 40+ should discuss mammography with their doctor; regular screening starts at 50."
+        )
+    ],
+    
+    "bone_health": [
+        QuizQuestion(
+            q="What is the recommended daily calcium intake for adults?",
+            opts=("500mg", "800mg", "1000-1200mg"),
+            ans=2,
+            exp="Adults need 1000-1200mg calcium daily for bone health."
+        ),
+        QuizQuestion(
+            q="Which vitamin is crucial for calcium absorption?",
+            opts=("Vitamin A", "Vitamin C", "Vitamin D"),
+            ans=2,
+            exp="Vitamin D is essential for calcium absorption in the intestines."
+        ),
+        QuizQuestion(
+            q="What type of exercise is best for bone health?",
+            opts=("Swimming", "Weight-bearing exercise", "Cycling"),
+            ans=1,
+            exp="Weight-bearing exercises (walking, jogging, strength training) build and maintain bone density."
+        )
+    ],
+    
+    "immune_system_health": [
+        QuizQuestion(
+            q="What percentage of immune system is in the gut?",
+            opts=("30%", "50%", "70%"),
+            ans=2,
+            exp="70% of our immune system is in the gut, making digestive health crucial."
+        ),
+        QuizQuestion(
+            q="How much sleep boosts immune function?",
+            opts=("5-6 hours", "7-9 hours", "10+ hours"),
+            ans=1,
+            exp="7-9 hours of sleep strengthens immune response and disease prevention."
+        ),
+        QuizQuestion(
+            q="Which nutrient is critical for immune cell production?",
+            opts=("Fat", "Zinc", "Sugar"),
+            ans=1,
+            exp="Zinc is essential for immune cell development and function."
+        )
+    ],
+    
+    "exercise_fitness": [
+        QuizQuestion(
+            q="How much moderate-intensity exercise is recommended weekly?",
+            opts=("75 minutes", "150 minutes", "300 minutes"),
+            ans=1,
+            exp="150 minutes of moderate-intensity aerobic activity weekly is recommended."
+        ),
+        QuizQuestion(
+            q="What does regular exercise reduce depression by?",
+            opts=("10%", "20%", "30%"),
+            ans=2,
+            exp="Regular exercise reduces depression symptoms by approximately 30%."
+        ),
+        QuizQuestion(
+            q="How many years can regular exercise add to lifespan?",
+            opts=("2-3 years", "5-7 years", "7-10 years"),
+            ans=2,
+            exp="Regular physical activity can add 7-10 years to life expectancy."
+        )
+    ]
+}
+
+# ============================================
+# MYTH DATABASE (parallel tuples, indexed by position)
+# ============================================
+
+MYTH_KEYS = ("cold", "sugar", "vitamin", "water", "knuckles")
+MYTH_CLAIMS = (
+    "Exposure to cold causes colds",
+    "Sugar makes children hyperactive",
+    "Vitamin C prevents colds",
+    "Drink exactly 8 glasses daily",
+    "Cracking knuckles causes arthritis"
+)
+MYTH_TRUTHS = (
+    "Viruses cause colds, not temperature",
+    "No scientific link found",
+    "Extra vitamin C doesn't prevent colds",
+    "Needs vary by person",
+    "No link found"
+)